@@ -6,32 +6,46 @@ This script implements REQ-002 from the PRD: "Prohibit blank lines within
 function bodies, so that function implementations remain compact and focused."
 
 Usage:
-    python blank_line_rule_poc.py <python_file>
+    python blank_line_rule_poc.py <python_file> [<python_file> ...]
 
 Example:
     python blank_line_rule_poc.py example.py
 """
 
+import ast
+import contextlib
+import hashlib
+import json
+import os
+import re
 import sys
 import argparse
 from pathlib import Path
-from typing import List, Optional
-from dataclasses import dataclass, field
+from collections.abc import Callable
+from typing import Any, ClassVar
+from dataclasses import asdict, dataclass, field
+from functools import cache, partial
 
-import libcst as cst
-from libcst.metadata import MetadataWrapper, PositionProvider
 
 
-@dataclass
+_VBL101_MESSAGE = (
+    "Blank line found within %s body. "
+    "Function implementations should remain compact and focused.")
+_NEWLINE = re.compile("\n")
+# Matches in place within a line; str.strip() would allocate a copy
+_WHITESPACE = re.compile(r"\s*")
+
+
+@dataclass(slots=True)
 class ViolationContext:
     """Context information for a violation."""
-    before_lines: List[str] = field(default_factory=list)
+    before_lines: list[str] = field(default_factory=list)
     violation_line: str = ""
-    after_lines: List[str] = field(default_factory=list)
+    after_lines: list[str] = field(default_factory=list)
     start_line_number: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Violation:
     """Represents a linting rule violation."""
     rule_id: str
@@ -40,7 +54,7 @@ class Violation:
     column: int
     message: str
     severity: str = "error"
-    context: Optional[ViolationContext] = None
+    context: ViolationContext | None = None
 
     def __str__(self) -> str:
         return (f"{self.filename}:{self.line}:{self.column}: "
@@ -75,218 +89,412 @@ class Violation:
         return "\n".join(lines)
 
 
-class BlankLineInFunctionVisitor(cst.CSTVisitor):
+def _child_fields(
+    node_type: type, nodes: tuple[str, ...], lists: tuple[str, ...]
+) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Keep the fields this Python version defines for a node type."""
+    defined = set(node_type._fields)
+    return (
+        tuple(name for name in nodes if name in defined),
+        tuple(name for name in lists if name in defined),
+    )
+
+
+# Node types whose children can hold statements, and therefore functions,
+# mapped to their child fields: (single node or None, list of nodes).
+# Classifying fields up front spares the walk the isinstance checks of
+# ast.iter_child_nodes. Everything else (expressions, simple statements)
+# is a leaf as far as the blank line rule is concerned. Context manager
+# items carry no positions of their own, so their expressions are walked
+# as the leaves instead.
+_FUNCTION_FIELDS = (
+    ("args", "returns"), ("decorator_list", "type_params", "body"))
+_CHILD_FIELDS = {
+    node_type: _child_fields(node_type, *fields)
+    for node_type, fields in (
+        (ast.Module, ((), ("body",))),
+        (ast.FunctionDef, _FUNCTION_FIELDS),
+        (ast.AsyncFunctionDef, _FUNCTION_FIELDS),
+        (ast.ClassDef, (
+            (), ("decorator_list", "type_params", "bases", "keywords",
+                 "body"))),
+        (ast.If, (("test",), ("body", "orelse"))),
+        (ast.For, (("target", "iter"), ("body", "orelse"))),
+        (ast.AsyncFor, (("target", "iter"), ("body", "orelse"))),
+        (ast.While, (("test",), ("body", "orelse"))),
+        (ast.Try, ((), ("body", "handlers", "orelse", "finalbody"))),
+        (getattr(ast, "TryStar", None),  # Python 3.11+
+         ((), ("body", "handlers", "orelse", "finalbody"))),
+        (ast.ExceptHandler, (("type",), ("body",))),
+        (ast.With, ((), ("items", "body"))),
+        (ast.AsyncWith, ((), ("items", "body"))),
+        (ast.withitem, (("context_expr", "optional_vars"), ())),
+        (ast.Match, (("subject",), ("cases",))),
+        (ast.match_case, (("pattern", "guard"), ("body",))),
+    )
+    if node_type is not None
+}
+
+
+class BlankLineInFunctionVisitor:
     """
     Visitor that detects blank lines within function bodies.
     
     Implementation approach:
-    1. Track when we enter/exit function bodies
-    2. Examine all SimpleStatementLine nodes within functions
-    3. Check for empty lines using PositionProvider coordinates
+    1. Collect the line range of every function definition
+    2. Record the lines spanned by leaf nodes (simple statements and
+       expressions), whose blank lines belong to strings or bracketed
+       continuations rather than to the function body
+    3. Attribute each remaining blank line to its innermost function
     4. Report violations with precise line numbers
-    5. Extract context lines around violations
     """
     
-    METADATA_DEPENDENCIES = (PositionProvider,)
+    # Handlers resolved once per node type; the class is not modified
+    # during a run, so entries never need invalidation.
+    _visit_cache: ClassVar[dict[type, Callable[..., Any] | None]] = {}
     
-    def __init__(self, filename: str, source_lines: List[str]):
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Give each subclass its own cache of resolved handlers."""
+        super().__init_subclass__(**kwargs)
+        cls._visit_cache = {}
+    
+    def __init__(self, filename: str, blank_mask: bytearray):
         self.filename = filename
-        self.source_lines = source_lines  # Original source code split by lines
-        self.violations: List[Violation] = []
-        self.function_stack: List[str] = []  # Track nested functions
-        self.function_body_lines: List[int] = []  # Lines within function body
-        
-    def visit_FunctionDef(self, node: cst.FunctionDef) -> None:
-        """Enter a function definition."""
-        function_name = node.name.value
-        is_async = node.asynchronous is not None
-        full_name = f"{'async ' if is_async else ''}function {function_name}"
-        
-        self.function_stack.append(full_name)
-        self.function_body_lines = []  # Reset for new function
-        
-        # Get function start position for context
-        try:
-            position = self.get_metadata(PositionProvider, node)
-            function_start_line = position.start.line
-        except KeyError:
-            function_start_line = -1
-        
-        # Store function info for potential violation reporting
-        self._current_function_start = function_start_line
+        self.blank_mask = blank_mask  # blank_mask[i] is 1 if line i+1 is blank
+        self.violations: list[Violation] = []
+        # (def line, last signature line, end line, display name)
+        # for every function
+        self._functions: list[tuple[int, int, int, str]] = []
+        # Lines inside multi-line leaf nodes, such as triple-quoted strings
+        self._covered_lines: set[int] = set()
 
-    def _extract_context(self, violation_line: int, context_lines: int = 2) -> ViolationContext:
-        """Extract context lines around a violation."""
-        # Convert to 0-based indexing
-        violation_idx = violation_line - 1
-        
-        # Calculate context bounds
-        start_idx = max(0, violation_idx - context_lines)
-        end_idx = min(len(self.source_lines), violation_idx + context_lines + 1)
-        
-        # Extract lines
-        before_lines = []
-        violation_text = ""
-        after_lines = []
-        
-        for i in range(start_idx, end_idx):
-            if i < violation_idx:
-                before_lines.append(self.source_lines[i] if i < len(self.source_lines) else "")
-            elif i == violation_idx:
-                violation_text = self.source_lines[i] if i < len(self.source_lines) else ""
-            else:
-                after_lines.append(self.source_lines[i] if i < len(self.source_lines) else "")
+    def walk(self, tree: ast.AST) -> None:
+        """
+        Traverse the syntax tree with an explicit stack, then report.
         
-        return ViolationContext(
-            before_lines=before_lines,
-            violation_line=violation_text,
-            after_lines=after_lines,
-            start_line_number=start_idx + 1  # Convert back to 1-based
-        )
+        A handler returning ``False`` skips the node's children. Only
+        container nodes (see ``_CHILD_FIELDS``) have their children
+        walked, since leaf subtrees can never hold a function body; the
+        span of each leaf is recorded instead.
+        """
+        cls = type(self)
+        visit_cache = cls._visit_cache
+        covered_lines = self._covered_lines
+        stack: list[ast.AST] = [tree]
+        while stack:
+            node = stack.pop()
+            node_type = type(node)
+            try:
+                handler = visit_cache[node_type]
+            except KeyError:
+                handler = visit_cache[node_type] = (
+                    cls._find_handler("visit_", node_type))
+            if handler is not None and handler(self, node) is False:
+                continue
+            fields = _CHILD_FIELDS.get(node_type)
+            if fields is not None:
+                nodes, lists = fields
+                for name in nodes:
+                    child = getattr(node, name)
+                    if child is not None:
+                        stack.append(child)
+                for name in lists:
+                    stack.extend(getattr(node, name))
+                continue
+            start = getattr(node, "lineno", None)
+            end = getattr(node, "end_lineno", None)
+            if start is not None and end is not None and end > start:
+                covered_lines.update(range(start + 1, end))
+        self._report()
 
-    def _create_violation_with_context(self, line: int, message: str) -> Violation:
-        """Create a violation with context information."""
-        context = self._extract_context(line)
-        
+    @classmethod
+    def _find_handler(
+        cls, prefix: str, node_type: type
+    ) -> Callable[..., Any] | None:
+        """Find the handler for a node type along the MRO."""
+        name = prefix + node_type.__name__
+        for klass in cls.__mro__:
+            handler = klass.__dict__.get(name)
+            if handler is not None:
+                return handler
+        return None
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        """Record the line range of a function definition."""
+        self._functions.append((
+            node.lineno, _signature_end(node), node.end_lineno,
+            f"function {node.name}"))
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
+        """Record the line range of an async function definition."""
+        self._functions.append((
+            node.lineno, _signature_end(node), node.end_lineno,
+            f"async function {node.name}"))
+
+    def visit_With(self, node: ast.With) -> None:
+        """Record the lines between the items of a with statement."""
+        last = node.items[-1]
+        end = (last.optional_vars or last.context_expr).end_lineno
+        self._covered_lines.update(range(node.lineno + 1, end))
+
+    visit_AsyncWith = visit_With
+
+    def _report(self) -> None:
+        """Attribute blank lines to their innermost enclosing functions."""
+        # Split the function ranges into non-overlapping segments, each
+        # owned by its innermost function, so every line is scanned once.
+        # Outer functions sort before the functions nested in them.
+        segments: list[tuple[int, int, str]] = []
+        open_functions: list[tuple[int, str]] = []  # (end line, name)
+        cursor = 0  # Index of the next line to assign
+        for start, signature_end, end, name in sorted(
+            self._functions, key=lambda function: (function[0], -function[2])
+        ):
+            while open_functions and open_functions[-1][0] < start:
+                stop, owner = open_functions.pop()
+                segments.append((cursor, stop, owner))
+                cursor = stop
+            if open_functions:
+                # Lines of the enclosing function up to the nested def
+                segments.append((cursor, start - 1, open_functions[-1][1]))
+            open_functions.append((end, name))
+            # Blank lines within a multi-line signature are not part of
+            # the body; start scanning after its last line
+            cursor = signature_end
+        while open_functions:
+            stop, owner = open_functions.pop()
+            segments.append((cursor, stop, owner))
+            cursor = stop
+        blank_mask = self.blank_mask
+        covered_lines = self._covered_lines
+        for first, stop, owner in segments:
+            message = _VBL101_MESSAGE % owner
+            for index in range(first, stop):
+                line = index + 1
+                if not blank_mask[index] or line in covered_lines:
+                    continue
+                self.violations.append(
+                    self._create_violation(line, message))
+
+    def _create_violation(self, line: int, message: str) -> Violation:
+        """Create a violation; context is attached only on request."""
         return Violation(
             rule_id="VBL101",
             filename=self.filename,
             line=line,
             column=1,
             message=message,
-            severity="error",
-            context=context
+            severity="error"
         )
 
-    def leave_FunctionDef(self, node: cst.FunctionDef) -> None:
-        """Exit a function definition and analyze collected lines."""
-        if self.function_stack:
-            self.function_stack.pop()
-        
-        # Analyze collected lines for blank lines
-        self._check_for_blank_lines_in_function()
-        self.function_body_lines = []
 
-    def visit_SimpleStatementLine(self, node: cst.SimpleStatementLine) -> None:
-        """
-        Track statement lines within function bodies.
-        
-        We examine SimpleStatementLine nodes because they represent individual
-        statements and can help us detect blank lines between them.
-        """
-        if not self.function_stack:
-            return  # Not inside a function
-        
-        try:
-            position = self.get_metadata(PositionProvider, node)
-            start_line = position.start.line
-            end_line = position.end.line
-            
-            # Record lines occupied by this statement
-            for line_num in range(start_line, end_line + 1):
-                self.function_body_lines.append(line_num)
-                
-        except KeyError:
-            # No position metadata available
-            pass
-
-    def visit_SimpleStatementSuite(
-        self, node: cst.SimpleStatementSuite
-    ) -> None:
-        """Handle simple statement suites (like single-line function bodies)."""
-        if not self.function_stack:
-            return
-            
-        try:
-            position = self.get_metadata(PositionProvider, node)
-            start_line = position.start.line
-            end_line = position.end.line
-            
-            for line_num in range(start_line, end_line + 1):
-                self.function_body_lines.append(line_num)
-                
-        except KeyError:
-            pass
+class _SourceLines:
+    """
+    Lines of a source text, sliced from it on demand.
+    
+    Only newline offsets are kept, so a file is never split into one
+    string per line; lines are materialized only for context output.
+    Lines end at ``\\n``, as for the tokenizer (lone ``\\r`` aside).
+    """
+    
+    __slots__ = ("content", "offsets")
+    
+    def __init__(self, content: str):
+        self.content = content
+        # Start offset of every line, then the end of the text
+        offsets = [0]
+        offsets.extend(match.end() for match in _NEWLINE.finditer(content))
+        if offsets[-1] != len(content):
+            offsets.append(len(content))  # Final line without a newline
+        self.offsets = offsets
+    
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+    
+    def __getitem__(self, index: int) -> str:
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return self.content[start:end].rstrip("\r\n")
+    
+    def classify_blanks(self) -> bytearray:
+        """Return a mask with 1 for each line holding only whitespace."""
+        content = self.content
+        offsets = self.offsets
+        match = _WHITESPACE.fullmatch
+        return bytearray(
+            match(content, offsets[index], offsets[index + 1]) is not None
+            for index in range(len(offsets) - 1))
 
-    def visit_IndentedBlock(self, node: cst.IndentedBlock) -> None:
-        """
-        Handle indented function bodies.
-        
-        This is where we can detect blank lines by examining the structure
-        of the indented block and looking for EmptyLine nodes.
-        """
-        if not self.function_stack:
-            return
-        
-        # Check for empty lines within the indented block
-        for stmt in node.body:
-            if hasattr(stmt, 'leading_lines'):
-                for leading_line in stmt.leading_lines:
-                    if isinstance(leading_line, cst.EmptyLine):
-                        # Found a blank line - this is a violation
-                        try:
-                            position = self.get_metadata(PositionProvider, stmt)
-                            # The empty line is before this statement
-                            violation_line = position.start.line - 1
-                            
-                            message = (f"Blank line found within {self.function_stack[-1]} body. "
-                                     f"Function implementations should remain compact and focused.")
-                            
-                            violation = self._create_violation_with_context(violation_line, message)
-                            self.violations.append(violation)
-                            
-                        except KeyError:
-                            # Fallback: report violation without precise line
-                            fallback_line = getattr(self, '_current_function_start', 1)
-                            message = (f"Blank line found within {self.function_stack[-1]} body. "
-                                     f"Function implementations should remain compact and focused.")
-                            
-                            violation = self._create_violation_with_context(fallback_line, message)
-                            self.violations.append(violation)
-
-    def _check_for_blank_lines_in_function(self) -> None:
-        """
-        Additional check for blank lines using line number analysis.
-        
-        This method looks for gaps in the line numbers to detect blank lines
-        that might not be caught by the EmptyLine approach.
-        """
-        if len(self.function_body_lines) < 2:
-            return  # Not enough lines to have gaps
-        
-        # Sort and deduplicate line numbers
-        sorted_lines = sorted(set(self.function_body_lines))
-        
-        # Look for gaps that indicate blank lines
-        for i in range(len(sorted_lines) - 1):
-            current_line = sorted_lines[i]
-            next_line = sorted_lines[i + 1]
-            
-            # If there's a gap > 1, there might be blank lines
-            if next_line - current_line > 1:
-                # This could indicate blank lines, but we need to be careful
-                # not to flag legitimate multi-line statements
-                gap_size = next_line - current_line - 1
-                
-                if gap_size > 0:
-                    # Report the first blank line in the gap
-                    blank_line = current_line + 1
-                    
-                    message = (f"Blank line found within {self.function_stack[-1] if self.function_stack else 'function'} body. "
-                             f"Function implementations should remain compact and focused.")
-                    
-                    # Avoid duplicate violations
-                    if not any(v.line == blank_line for v in self.violations):
-                        violation = self._create_violation_with_context(blank_line, message)
-                        self.violations.append(violation)
-
-
-def check_blank_lines_in_file(file_path: Path) -> List[Violation]:
+
+def _extract_context(
+    source_lines: _SourceLines, violation_line: int, context_lines: int = 2
+) -> ViolationContext:
+    """Extract context lines around a violation."""
+    # Convert to 0-based indexing
+    violation_idx = violation_line - 1
+    
+    # Calculate context bounds
+    start_idx = max(0, violation_idx - context_lines)
+    end_idx = min(len(source_lines), violation_idx + context_lines + 1)
+    
+    # Extract lines
+    before_lines = []
+    violation_text = ""
+    after_lines = []
+    
+    for i in range(start_idx, end_idx):
+        if i < violation_idx:
+            before_lines.append(source_lines[i])
+        elif i == violation_idx:
+            violation_text = source_lines[i]
+        else:
+            after_lines.append(source_lines[i])
+    
+    return ViolationContext(
+        before_lines=before_lines,
+        violation_line=violation_text,
+        after_lines=after_lines,
+        start_line_number=start_idx + 1  # Convert back to 1-based
+    )
+
+
+def _attach_contexts(
+    violations: list[Violation], source_lines: _SourceLines
+) -> list[Violation]:
+    """Attach context lines to each violation, for --context output."""
+    for violation in violations:
+        violation.context = _extract_context(source_lines, violation.line)
+    return violations
+
+
+def _signature_end(node: ast.AST) -> int:
+    """
+    Find the last line of a function signature.
+    
+    ``ast.arguments`` carries no position, so the span is taken from the
+    parameters, defaults, and annotations within it instead.
+    """
+    end = node.lineno
+    for part in (node.args, node.returns):
+        if part is None:
+            continue
+        for child in ast.walk(part):
+            end = max(end, getattr(child, "end_lineno", None) or end)
+    return end
+
+
+@cache
+def _load_native_classifier() -> Callable[[bytes], bytearray] | None:
+    """
+    Compile the native blank line classifier, or None without Numba.
+    
+    The classifier is built once per process and shared by every file.
+    
+    The kernel scans the UTF-8 bytes for ``\\n`` and treats ASCII spaces,
+    tabs, carriage returns, vertical tabs, and form feeds as whitespace.
+    It is worth its compilation cost only on very large files.
+    """
+    try:
+        import numba
+        import numpy as np
+    except ImportError:
+        return None
+
+    @numba.njit(cache=True, nogil=True)
+    def classify_kernel(buffer, mask):  # pragma: no cover - compiled
+        line = 0
+        blank = True
+        for byte in buffer:
+            if byte == 10:
+                mask[line] = blank
+                line += 1
+                blank = True
+            elif byte != 32 and (byte < 9 or byte > 13):
+                blank = False
+        if line < mask.shape[0]:
+            mask[line] = blank
+
+    def classify(data: bytes) -> bytearray:
+        # Mirror _SourceLines: no entry for an empty final line
+        count = data.count(b"\n")
+        if data and not data.endswith(b"\n"):
+            count += 1
+        mask = np.zeros(count, dtype=np.uint8)
+        classify_kernel(np.frombuffer(data, dtype=np.uint8), mask)
+        return bytearray(mask.tobytes())
+
+    return classify
+
+
+# Bump whenever the analysis changes, so stale cache entries are ignored.
+_CACHE_VERSION = 2
+
+
+def _violation_to_cache_entry(violation: Violation) -> dict[str, Any]:
+    """Serialize a violation for the cache, without its filename."""
+    entry = asdict(violation)
+    del entry["filename"]
+    return entry
+
+
+def _violation_from_cache_entry(
+    entry: dict[str, Any], filename: str
+) -> Violation:
+    """Rebuild a violation from a cache entry for the given file."""
+    context = entry.pop("context")
+    return Violation(
+        filename=filename,
+        context=ViolationContext(**context) if context else None,
+        **entry,
+    )
+
+
+def _load_cached_violations(
+    cache_file: Path, filename: str
+) -> list[Violation] | None:
+    """Load violations from a cache file, or None on a miss."""
+    try:
+        entries = json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return [_violation_from_cache_entry(entry, filename) for entry in entries]
+
+
+def _store_cached_violations(
+    cache_file: Path, violations: list[Violation]
+) -> None:
+    """Write violations to a cache file atomically; failures are ignored."""
+    entries = [_violation_to_cache_entry(violation) for violation in violations]
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        import tempfile  # Only needed when caching
+        descriptor, temporary = tempfile.mkstemp(
+            dir=cache_file.parent, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(descriptor, "w", encoding="utf-8") as stream:
+            json.dump(entries, stream)
+        os.replace(temporary, cache_file)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.unlink(temporary)
+
+
+def check_blank_lines_in_file(
+    file_path: Path,
+    cache_dir: Path | None = None,
+    jit: bool = False,
+    context: bool = False,
+) -> list[Violation]:
     """
     Check a Python file for blank lines within function bodies.
     
     Args:
         file_path: Path to the Python file to check
+        cache_dir: Directory of results keyed by content hash; when given,
+            unchanged files are answered from it without parsing
+        jit: Classify lines with the Numba kernel, when Numba is installed
+        context: Attach the lines around each violation
         
     Returns:
         List of violations found
@@ -294,26 +502,51 @@ def check_blank_lines_in_file(file_path: Path) -> List[Violation]:
     Raises:
         FileNotFoundError: If the file doesn't exist
         UnicodeDecodeError: If the file can't be decoded as text
-        libcst.ParserSyntaxError: If the file has syntax errors
+        SyntaxError: If the file has syntax errors
     """
     try:
         # Read the file
-        content = file_path.read_text(encoding='utf-8')
-        source_lines = content.splitlines()
-        
-        # Parse with LibCST
-        module = cst.parse_module(content)
-        
-        # Create metadata wrapper for position information
-        wrapper = MetadataWrapper(module)
-        
-        # Create and run the visitor with source lines for context
-        visitor = BlankLineInFunctionVisitor(str(file_path), source_lines)
-        wrapper.visit(visitor)
-        
+        data = file_path.read_bytes()
+        # Without a def, nothing can violate VBL101; skip hashing and parsing
+        if b"def" not in data:
+            return []
+        cache_file = None
+        if cache_dir is not None:
+            # The bytes are needed for parsing anyway, so hash them in
+            # memory rather than streaming the file a second time.
+            digest = hashlib.sha256(
+                b"%d:" % _CACHE_VERSION + data).hexdigest()
+            cache_file = cache_dir / f"{digest}.json"
+            cached = _load_cached_violations(cache_file, str(file_path))
+            if cached is not None:
+                if context:
+                    _attach_contexts(
+                        cached, _SourceLines(data.decode('utf-8')))
+                return cached
+        content = data.decode('utf-8')
+        source_lines = _SourceLines(content)
+        # Classify every line once, up front; the visitor only indexes it
+        classify = _load_native_classifier() if jit else None
+        if classify is not None:
+            blank_mask = classify(data)
+        else:
+            blank_mask = source_lines.classify_blanks()
+        
+        # Parse with the stdlib parser; positions come with every node
+        tree = ast.parse(content, filename=str(file_path))
+        
+        # Create and run the visitor
+        visitor = BlankLineInFunctionVisitor(str(file_path), blank_mask)
+        visitor.walk(tree)
+        
+        # Cache entries never carry context; it is cheap to rebuild
+        if cache_file is not None:
+            _store_cached_violations(cache_file, visitor.violations)
+        if context:
+            _attach_contexts(visitor.violations, source_lines)
         return visitor.violations
         
-    except cst.ParserSyntaxError as e:
+    except SyntaxError as e:
         # Handle syntax errors gracefully
         return [Violation(
             rule_id="VBL101",
@@ -335,8 +568,51 @@ def check_blank_lines_in_file(file_path: Path) -> List[Violation]:
         )]
 
 
-def main() -> int:
-    """Main entry point for the script."""
+# Files each automatic worker process must have to be worth starting
+_FILES_PER_AUTOMATIC_WORKER = 32
+
+
+def check_blank_lines_in_files(
+    paths: list[Path],
+    workers: int | None = None,
+    cache_dir: Path | None = None,
+    jit: bool = False,
+    context: bool = False,
+) -> dict[Path, list[Violation]]:
+    """
+    Check several Python files, parsing them in parallel processes.
+    
+    Args:
+        paths: Paths to the Python files to check
+        workers: Number of worker processes (default: one per CPU, when
+            there are enough files to keep each one busy)
+        cache_dir: Directory of cached results, as for
+            ``check_blank_lines_in_file``
+        jit: Classify lines with the Numba kernel, when Numba is installed
+        context: Attach the lines around each violation
+        
+    Returns:
+        Violations per file, in the order the paths were given
+    """
+    check = partial(
+        check_blank_lines_in_file, cache_dir=cache_dir, jit=jit, context=context)
+    if workers is None:
+        workers = min(
+            os.cpu_count() or 1, len(paths) // _FILES_PER_AUTOMATIC_WORKER)
+    if len(paths) < 2 or workers <= 1:
+        # A pool costs more to start than a few files cost to check
+        return {path: check(path) for path in paths}
+    # Batch small files so pickling round trips do not dominate
+    chunksize = max(1, len(paths) // (4 * workers))
+    # Deferred: concurrent.futures pulls in logging, which single-file
+    # runs and --help should not pay for.
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return dict(zip(paths, executor.map(check, paths, chunksize=chunksize)))
+
+
+def _create_parser() -> argparse.ArgumentParser:
+    """Build the command line parser."""
     parser = argparse.ArgumentParser(
         description="Check Python files for blank lines within function bodies (VBL101)",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -344,7 +620,9 @@ def main() -> int:
 Examples:
   python blank_line_rule_poc.py example.py
   python blank_line_rule_poc.py src/module.py --context
+  python blank_line_rule_poc.py src/*.py --jobs 4
   python blank_line_rule_poc.py test.py -c -v
+  python blank_line_rule_poc.py test.py --cache-dir
   
 Rule VBL101: Prohibit blank lines within function bodies so that function 
 implementations remain compact and focused.
@@ -355,9 +633,10 @@ understanding of the code structure.
     )
     
     parser.add_argument(
-        'file',
+        'files',
         type=Path,
-        help='Python file to check'
+        nargs='+',
+        help='Python files to check'
     )
     
     parser.add_argument(
@@ -372,27 +651,66 @@ understanding of the code structure.
         help='Show context lines around violations'
     )
     
-    args = parser.parse_args()
+    parser.add_argument(
+        '--cache-dir',
+        type=Path,
+        nargs='?',
+        const=Path('.vibelinter-cache'),
+        default=None,
+        help='Reuse results for unchanged files (default: .vibelinter-cache)'
+    )
+    
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=None,
+        help='Number of worker processes (default: one per CPU, for many files)'
+    )
     
-    # Validate file exists
-    if not args.file.exists():
-        print(f"Error: File {args.file} does not exist", file=sys.stderr)
-        return 1
+    parser.add_argument(
+        '--jit',
+        action='store_true',
+        help='Classify lines with a Numba kernel (for very large files)'
+    )
     
-    if not args.file.is_file():
-        print(f"Error: {args.file} is not a file", file=sys.stderr)
-        return 1
+    return parser
+
+
+def main() -> int:
+    """Main entry point for the script."""
+    args = _create_parser().parse_args()
+    
+    # Validate files exist
+    for file in args.files:
+        if not file.exists():
+            print(f"Error: File {file} does not exist", file=sys.stderr)
+            return 1
+        
+        if not file.is_file():
+            print(f"Error: {file} is not a file", file=sys.stderr)
+            return 1
+        
+        # Check file extension
+        if file.suffix != '.py':
+            print(f"Warning: {file} does not have .py extension", file=sys.stderr)
     
-    # Check file extension
-    if args.file.suffix != '.py':
-        print(f"Warning: {args.file} does not have .py extension", file=sys.stderr)
+    if args.jit and _load_native_classifier() is None:
+        print("Warning: --jit requires numba and numpy; using pure Python",
+              file=sys.stderr)
     
     if args.verbose:
-        print(f"Checking {args.file} for blank lines in function bodies...")
+        print(f"Checking {len(args.files)} file(s) for blank lines in function bodies...")
     
     # Run the check
     try:
-        violations = check_blank_lines_in_file(args.file)
+        results = check_blank_lines_in_files(
+            args.files, workers=args.jobs, cache_dir=args.cache_dir,
+            jit=args.jit, context=args.context)
+        violations = [
+            violation
+            for file_violations in results.values()
+            for violation in file_violations
+        ]
         
         # Report results
         if violations:
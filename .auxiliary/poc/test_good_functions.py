@@ -50,6 +50,15 @@ def multiline_statement():
     result = process(data)
     return result
 
+async def multiline_context_managers(first, second):
+    """Async function with parenthesized context managers."""
+    async with (
+        first as a,
+
+        second as b,
+    ):
+        return a, b
+
 # Module-level code can have blank lines
 
 global_var = "test"
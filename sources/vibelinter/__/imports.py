@@ -25,10 +25,15 @@
 
 import                      abc
 import collections.abc as   cabc
+import                      codecs
+import concurrent.futures as cfutures
 import contextlib as        ctxl
 import dataclasses as       dcls
 import                      enum
+import functools as         funct
+import itertools as         itert
 import                      json
+import                      operator
 import                      os
 import                      pathlib
 import                      sys
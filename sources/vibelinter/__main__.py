@@ -21,8 +21,13 @@
 ''' Entrypoint. '''
 
 
+import multiprocessing
+
 # Note: Use absolute import for PyInstaller happiness.
 from vibelinter.cli import execute
 
 
-if '__main__' == __name__: execute( )
+if '__main__' == __name__:
+    # Frozen executables must hand spawned workers off before the CLI runs.
+    multiprocessing.freeze_support( )
+    execute( )
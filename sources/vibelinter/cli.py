@@ -28,11 +28,18 @@ from appcore import cli as _appcore_cli
 from . import __
 from . import configuration as _configuration
 from . import engine as _engine
+from . import exceptions as _exceptions
 from . import rules as _rules
 # Ensure registry is available for type hints
 from .rules import registry as _registry
 
 
+# Shared by every option without a subcommand prefix.
+_UNPREFIXED = __.tyro.conf.arg( prefix_name = False )
+# Files needed per worker before automatic jobs sizing adds a process.
+_FILES_PER_AUTOMATIC_WORKER = 32
+
+
 class DiffFormats( __.enum.Enum ):
     ''' Diff visualization formats. '''
 
@@ -55,24 +62,37 @@ class DisplayOptions( _appcore_cli.DisplayOptions ):
 
     format: __.typx.Annotated[
         DisplayFormats,
-        __.tyro.conf.arg( prefix_name = False ),
+        _UNPREFIXED,
         __.ddoc.Doc( ''' Output format for reporting. ''' )
     ] = DisplayFormats.Text
     context: __.typx.Annotated[
         int,
-        __.tyro.conf.arg( prefix_name = False ),
+        _UNPREFIXED,
         __.ddoc.Doc( ''' Show context lines around violations. ''' )
     ] = 0
 
 
+@__.funct.cache
+def _produce_default_display( ) -> DisplayOptions:
+    ''' Produces default display options, shared since they are immutable. '''
+    return DisplayOptions( )
+
+
 RuleSelectorArgument: __.typx.TypeAlias = __.typx.Annotated[
     str,
-    __.tyro.conf.arg( prefix_name = False ),
+    _UNPREFIXED,
     __.ddoc.Doc(
         ''' Comma-separated rule identifiers '''
         ''' (e.g. VBL101, function-ordering). '''
     )
 ]
+DetailsArgument: __.typx.TypeAlias = __.typx.Annotated[
+    bool,
+    _UNPREFIXED,
+    __.ddoc.Doc(
+        ''' Display detailed rule information including '''
+        ''' configuration status. ''' )
+]
 PathsArgument: __.typx.TypeAlias = __.tyro.conf.Positional[
     tuple[ str, ... ]
 ]
@@ -101,7 +121,7 @@ class CheckResult( RenderableResult ):
     ''' Result from check command execution. '''
 
     paths: tuple[ str, ... ]
-    reports: tuple[ __.typx.Any, ... ]  # Engine Report objects
+    reports: tuple[ _engine.Report, ... ]
     total_violations: int
     total_files: int
     rule_selection: __.Absential[ str ] = __.absent
@@ -109,17 +129,16 @@ class CheckResult( RenderableResult ):
     def render_as_json( self ) -> dict[ str, __.typx.Any ]:
         ''' Renders result as JSON-compatible dictionary. '''
         files_data: list[ dict[ str, __.typx.Any ] ] = [ ]
-        for report_obj in self.reports:
-            typed_report = __.typx.cast( _engine.Report, report_obj )
+        for report in self.reports:
             violations_data = [
-                v.render_as_json( ) for v in typed_report.violations
+                v.render_as_json( ) for v in report.violations
             ]
             files_data.append( {
-                'filename': typed_report.filename,
+                'filename': report.filename,
                 'violations': violations_data,
-                'violation_count': len( typed_report.violations ),
-                'rule_count': typed_report.rule_count,
-                'analysis_duration_ms': typed_report.analysis_duration_ms,
+                'violation_count': len( report.violations ),
+                'rule_count': report.rule_count,
+                'analysis_duration_ms': report.analysis_duration_ms,
             } )
         result: dict[ str, __.typx.Any ] = {
             'files': files_data,
@@ -133,13 +152,12 @@ class CheckResult( RenderableResult ):
     def render_as_text( self ) -> tuple[ str, ... ]:
         ''' Renders result as text lines. '''
         lines: list[ str ] = [ ]
-        for report_obj in self.reports:
-            typed_report = __.typx.cast( _engine.Report, report_obj )
-            if typed_report.violations:
-                lines.append( f'\n{typed_report.filename}:' )
+        for report in self.reports:
+            if report.violations:
+                lines.append( f'\n{report.filename}:' )
                 lines.extend(
                     v.render_as_text( )
-                    for v in typed_report.violations )
+                    for v in report.violations )
         if not lines:
             lines.append( 'No violations found.' )
         else:
@@ -161,7 +179,7 @@ class FixResult( RenderableResult ):
     def render_as_json( self ) -> dict[ str, __.typx.Any ]:
         ''' Renders result as JSON-compatible dictionary. '''
         result: dict[ str, __.typx.Any ] = {
-            'paths': list( self.paths ),
+            'paths': self.paths,
             'simulate': self.simulate,
             'diff_format': self.diff_format,
             'apply_dangerous': self.apply_dangerous,
@@ -231,7 +249,8 @@ class DescribeRulesResult( RenderableResult ):
     def render_as_text( self ) -> tuple[ str, ... ]:
         ''' Renders result as text lines. '''
         lines = [ 'Available rules:' ]
-        for rule in sorted( self.rules, key = lambda r: r.descriptive_name ):
+        by_name = __.operator.attrgetter( 'descriptive_name' )
+        for rule in sorted( self.rules, key = by_name ):
             if self.details:
                 lines.append(
                     f'  {rule.descriptive_name} ({rule.vbl_code}) - '
@@ -320,14 +339,12 @@ class CheckCommand( __.immut.DataclassObject ):
     select: __.Absential[ RuleSelectorArgument ] = __.absent
     jobs: __.typx.Annotated[
         __.typx.Union[ int, __.typx.Literal[ 'auto' ] ],
-        __.tyro.conf.arg( prefix_name = False ),
+        _UNPREFIXED,
         __.ddoc.Doc( ''' Number of parallel processing jobs. ''' )
     ] = 'auto'
 
     async def __call__( self, display: DisplayOptions ) -> int:
         ''' Executes the check command. '''
-        # TODO: Implement parallel processing with jobs parameter
-        _ = self.jobs  # Suppress vulture warning
         config = _configuration.discover_configuration( )
         file_paths = _discover_python_files( self.paths )
         if not __.is_absent( config ):
@@ -340,11 +357,11 @@ class CheckCommand( __.immut.DataclassObject ):
                 total_files = 0,
                 rule_selection = self.select,
             )
-            async with __.ctxl.AsyncExitStack( ) as exits:
-                await _render_and_print_result( result, display, exits )
+            await _render_and_print_result( result, display )
             return 0
+        registry_manager = _rules.create_registry_manager( )
         enabled_rules = _merge_rule_selection(
-            self.select, config, _rules.create_registry_manager( ) )
+            self.select, config, registry_manager )
         context_size = _merge_context_size( display.context, config )
         rule_parameters: __.immut.Dictionary[
             str, __.immut.Dictionary[ str, __.typx.Any ] ]
@@ -362,9 +379,11 @@ class CheckCommand( __.immut.DataclassObject ):
             rule_parameters = rule_parameters,
             per_file_ignores = per_file_ignores,
         )
-        registry_manager = _rules.create_registry_manager( )
         engine = _engine.Engine( registry_manager, configuration )
-        reports = engine.lint_files( file_paths )
+        reports = engine.lint_files(
+            file_paths,
+            workers = _calculate_workers_count(
+                self.jobs, len( file_paths ) ) )
         total_violations = sum( len( r.violations ) for r in reports )
         result = CheckResult(
             paths = self.paths,
@@ -373,8 +392,7 @@ class CheckCommand( __.immut.DataclassObject ):
             total_files = len( reports ),
             rule_selection = self.select,
         )
-        async with __.ctxl.AsyncExitStack( ) as exits:
-            await _render_and_print_result( result, display, exits )
+        await _render_and_print_result( result, display )
         return 1 if total_violations > 0 else 0
 
 
@@ -385,17 +403,17 @@ class FixCommand( __.immut.DataclassObject ):
     select: __.Absential[ RuleSelectorArgument ] = __.absent
     simulate: __.typx.Annotated[
         bool,
-        __.tyro.conf.arg( prefix_name = False ),
+        _UNPREFIXED,
         __.ddoc.Doc( ''' Preview changes without applying them. ''' )
     ] = False
     diff_format: __.typx.Annotated[
         DiffFormats,
-        __.tyro.conf.arg( prefix_name = False ),
+        _UNPREFIXED,
         __.ddoc.Doc( ''' Diff visualization format. ''' )
     ] = DiffFormats.Unified
     apply_dangerous: __.typx.Annotated[
         bool,
-        __.tyro.conf.arg( prefix_name = False ),
+        _UNPREFIXED,
         __.ddoc.Doc( ''' Enable potentially unsafe fixes. ''' )
     ] = False
 
@@ -408,8 +426,7 @@ class FixCommand( __.immut.DataclassObject ):
             apply_dangerous = self.apply_dangerous,
             rule_selection = self.select,
         )
-        async with __.ctxl.AsyncExitStack( ) as exits:
-            await _render_and_print_result( result, display, exits )
+        await _render_and_print_result( result, display )
         return 0
 
 
@@ -418,18 +435,18 @@ class ConfigureCommand( __.immut.DataclassObject ):
 
     validate: __.typx.Annotated[
         bool,
-        __.tyro.conf.arg( prefix_name = False ),
+        _UNPREFIXED,
         __.ddoc.Doc(
             ''' Validate existing configuration without analysis. ''' )
     ] = False
     interactive: __.typx.Annotated[
         bool,
-        __.tyro.conf.arg( prefix_name = False ),
+        _UNPREFIXED,
         __.ddoc.Doc( ''' Interactive configuration wizard. ''' )
     ] = False
     display_effective: __.typx.Annotated[
         bool,
-        __.tyro.conf.arg( prefix_name = False ),
+        _UNPREFIXED,
         __.ddoc.Doc( ''' Display effective merged configuration. ''' )
     ] = False
 
@@ -440,29 +457,21 @@ class ConfigureCommand( __.immut.DataclassObject ):
             interactive = self.interactive,
             display_effective = self.display_effective,
         )
-        async with __.ctxl.AsyncExitStack( ) as exits:
-            await _render_and_print_result( result, display, exits )
+        await _render_and_print_result( result, display )
         return 0
 
 
 class DescribeRulesCommand( __.immut.DataclassObject ):
     ''' Lists all available rules with descriptions. '''
 
-    details: __.typx.Annotated[
-        bool,
-        __.tyro.conf.arg( prefix_name = False ),
-        __.ddoc.Doc(
-            ''' Display detailed rule information including '''
-            ''' configuration status. ''' )
-    ] = False
+    details: DetailsArgument = False
 
     async def __call__( self, display: DisplayOptions ) -> int:
         ''' Executes the describe rules command. '''
         registry_manager = _rules.create_registry_manager( )
         rules = registry_manager.survey_available_rules( )
         result = DescribeRulesResult( rules = rules, details = self.details )
-        async with __.ctxl.AsyncExitStack( ) as exits:
-            await _render_and_print_result( result, display, exits )
+        await _render_and_print_result( result, display )
         return 0
 
 
@@ -470,13 +479,7 @@ class DescribeRuleCommand( __.immut.DataclassObject ):
     ''' Displays detailed information for a specific rule. '''
 
     rule_id: __.tyro.conf.Positional[ str ]
-    details: __.typx.Annotated[
-        bool,
-        __.tyro.conf.arg( prefix_name = False ),
-        __.ddoc.Doc(
-            ''' Display detailed rule information including '''
-            ''' configuration status. ''' )
-    ] = False
+    details: DetailsArgument = False
 
     async def __call__( self, display: DisplayOptions ) -> int:
         ''' Executes the describe rule command. '''
@@ -487,8 +490,7 @@ class DescribeRuleCommand( __.immut.DataclassObject ):
             rule = rule_descriptor,
             details = self.details,
         )
-        async with __.ctxl.AsyncExitStack( ) as exits:
-            await _render_and_print_result( result, display, exits )
+        await _render_and_print_result( result, display )
         return 0
 
 
@@ -516,15 +518,14 @@ class ServeCommand( __.immut.DataclassObject ):
 
     protocol: __.typx.Annotated[
         __.typx.Literal[ 'lsp', 'mcp' ],
-        __.tyro.conf.arg( prefix_name = False ),
+        _UNPREFIXED,
         __.ddoc.Doc( ''' Protocol server to start. ''' )
     ] = 'mcp'
 
     async def __call__( self, display: DisplayOptions ) -> int:
         ''' Executes the serve command. '''
         result = ServeResult( protocol = self.protocol )
-        async with __.ctxl.AsyncExitStack( ) as exits:
-            await _render_and_print_result( result, display, exits )
+        await _render_and_print_result( result, display )
         return 0
 
 
@@ -556,8 +557,8 @@ class Cli( __.immut.DataclassObject ):
     ]
     display: __.typx.Annotated[
         DisplayOptions,
-        __.tyro.conf.arg( prefix_name = False ),
-    ] = __.dcls.field( default_factory = DisplayOptions )
+        _UNPREFIXED,
+    ] = __.dcls.field( default_factory = _produce_default_display )
     verbose: __.typx.Annotated[
         bool,
         __.ddoc.Doc( ''' Enable verbose output. ''' )
@@ -581,7 +582,8 @@ def execute( ) -> None:
     )
     try: run( __.tyro.cli( Cli, config = config )( ) ) # pyright: ignore
     except SystemExit: raise
-    except BaseException:
+    except KeyboardInterrupt: raise SystemExit( 130 ) from None
+    except Exception:
         # TODO: Log exception with proper error handling
         raise SystemExit( 1 ) from None
 
@@ -596,56 +598,65 @@ async def intercept_errors(
         display format. Handles unexpected exceptions by logging and
         formatting as errors.
     '''
-    from . import exceptions as _exceptions
     try:
         yield
-    except _exceptions.Omnierror as exc:
-        async with __.ctxl.AsyncExitStack( ) as exits:
-            stream = await display.provide_stream( exits )
-            match display.format:
-                case DisplayFormats.Json:
-                    stream.write(
-                        __.json.dumps( exc.render_as_json( ), indent = 2 ) )
-                    stream.write( '\n' )
-                case DisplayFormats.Text:
-                    for line in exc.render_as_text( ):
-                        stream.write( line )
-                        stream.write( '\n' )
-        raise SystemExit( 1 ) from exc
     except ( SystemExit, KeyboardInterrupt ):
         raise
     except BaseException as exc:
-        # TODO: Log exception with proper error handling via scribe
+        # TODO: Log unexpected exceptions with proper handling via scribe
         async with __.ctxl.AsyncExitStack( ) as exits:
             stream = await display.provide_stream( exits )
-            match display.format:
-                case DisplayFormats.Json:
-                    error_data = {
-                        'type': 'unexpected_error',
-                        'message': str( exc ),
-                    }
-                    stream.write( __.json.dumps( error_data, indent = 2 ) )
-                    stream.write( '\n' )
-                case DisplayFormats.Text:
-                    stream.write( '## Unexpected Error\n' )
-                    stream.write( f'**Message**: {exc}\n' )
+            _ERROR_RENDERERS[ display.format ]( exc, stream )
         raise SystemExit( 1 ) from exc
 
 
+def _calculate_workers_count(
+    jobs: __.typx.Union[ int, __.typx.Literal[ 'auto' ] ],
+    files_count: int,
+) -> int:
+    ''' Calculates number of worker processes from jobs option.
+
+        Automatic sizing stays serial for small inputs. Starting a worker
+        process, which reimports the linter under the spawn start method,
+        costs more than linting a few files in the current process.
+    '''
+    if jobs == 'auto':
+        workers = files_count // _FILES_PER_AUTOMATIC_WORKER
+        return max( 1, min( __.os.cpu_count( ) or 1, workers ) )
+    return max( 1, jobs )
+
+
 def _discover_python_files(
     paths: __.cabc.Sequence[ str ]
 ) -> tuple[ __.pathlib.Path, ... ]:
     ''' Discovers Python files from file paths or directories. '''
-    python_files: list[ __.pathlib.Path ] = [ ]
+    python_files: set[ str ] = set( )
     for path_str in paths:
-        path = __.pathlib.Path( path_str )
-        if not path.exists( ):
-            continue
-        if path.is_file( ) and path.suffix == '.py':
-            python_files.append( path )
-        elif path.is_dir( ):
-            python_files.extend( path.rglob( '*.py' ) )
-    return tuple( sorted( set( python_files ) ) )
+        if __.os.path.isdir( path_str ):
+            python_files.update( _survey_python_files( path_str ) )
+        elif path_str.endswith( '.py' ) and __.os.path.isfile( path_str ):
+            python_files.add( path_str )
+    return tuple( sorted( set( map( __.pathlib.Path, python_files ) ) ) )
+
+
+def _survey_python_files( directory: str ) -> list[ str ]:
+    ''' Collects Python files beneath directory without following links.
+
+        Uses directory entry types from scandir, avoiding a stat call per
+        entry on most filesystems.
+    '''
+    python_files: list[ str ] = [ ]
+    directories = [ directory ]
+    while directories:
+        try: scanner = __.os.scandir( directories.pop( ) )
+        except OSError: continue
+        with scanner:
+            for entry in scanner:
+                if entry.is_dir( follow_symlinks = False ):
+                    directories.append( entry.path )
+                elif entry.name.endswith( '.py' ):
+                    python_files.append( entry.path )
+    return python_files
 
 
 def _apply_path_filters(
@@ -654,32 +665,26 @@ def _apply_path_filters(
 ) -> tuple[ __.pathlib.Path, ... ]:
     ''' Applies include/exclude path filters from configuration. '''
     typed_config = __.typx.cast( _configuration.Configuration, config )
-    filtered = list( file_paths )
+    filtered = [ ( str( fp ), fp ) for fp in file_paths ]
     if not __.is_absent( typed_config.include_paths ):
+        matcher = _produce_path_matcher( typed_config.include_paths )
         filtered = [
-            fp for fp in filtered
-            if _matches_any_pattern( fp, typed_config.include_paths )
-        ]
+            entry for entry in filtered if matcher.match( entry[ 0 ] ) ]
     if not __.is_absent( typed_config.exclude_paths ):
-        patterns = typed_config.exclude_paths
+        matcher = _produce_path_matcher( typed_config.exclude_paths )
         filtered = [
-            fp for fp in filtered
-            if not _matches_any_pattern( fp, patterns )
-        ]
-    return tuple( filtered )
+            entry for entry in filtered if not matcher.match( entry[ 0 ] ) ]
+    return tuple( fp for _, fp in filtered )
+
 
+def _produce_path_matcher(
+    patterns: tuple[ str, ... ]
+) -> __.wcglob.WcMatcher[ str ]:
+    ''' Produces matcher for any of glob patterns.
 
-def _matches_any_pattern(
-    file_path: __.pathlib.Path,
-    patterns: tuple[ str, ... ],
-) -> bool:
-    ''' Checks if file path matches any glob pattern. '''
-    path_str = str( file_path )
-    for pattern in patterns:
-        if __.wcglob.globmatch(
-            path_str, pattern, flags = __.wcglob.GLOBSTAR ):
-            return True
-    return False
+        Patterns are compiled once, rather than once per file path.
+    '''
+    return __.wcglob.compile( patterns, flags = __.wcglob.GLOBSTAR )
 
 
 def _merge_context_size(
@@ -718,14 +723,17 @@ def _merge_rule_selection(
     registry_manager: _registry.RuleRegistryManager,
 ) -> frozenset[ str ]:
     ''' Merges rule selection from CLI and configuration. '''
-    from .rules.implementations.__ import RULE_DESCRIPTORS
-    all_rules = frozenset( RULE_DESCRIPTORS.keys( ) )
+    all_rules = frozenset( registry_manager.registry )
     if not __.is_absent( cli_selection ):
         return frozenset( _resolve_rule_set(
             cli_selection.split( ',' ), registry_manager ) )
     if __.is_absent( config ):
         return all_rules
     typed_config = __.typx.cast( _configuration.Configuration, config )
+    if (
+        __.is_absent( typed_config.select )
+        and __.is_absent( typed_config.exclude_rules )
+    ): return all_rules
     if not __.is_absent( typed_config.select ):
         selected = _resolve_rule_set(
             typed_config.select, registry_manager )
@@ -741,15 +749,98 @@ def _merge_rule_selection(
 async def _render_and_print_result(
     result: RenderableResult,
     display: DisplayOptions,
-    exits: __.ctxl.AsyncExitStack,
 ) -> None:
     ''' Renders and prints a result object based on display options. '''
-    stream = await display.provide_stream( exits )
-    match display.format:
-        case DisplayFormats.Json:
-            stream.write( __.json.dumps( result.render_as_json( ) ) )
-            stream.write( '\n' )
-        case DisplayFormats.Text:
-            for line in result.render_as_text( ):
-                stream.write( line )
-                stream.write( '\n' )
+    async with __.ctxl.AsyncExitStack( ) as exits:
+        # Target files are opened on the stack and closed after rendering.
+        stream = await display.provide_stream( exits )
+        _RESULT_RENDERERS[ display.format ]( result, stream )
+
+
+def _render_result_as_json(
+    result: RenderableResult, stream: __.typx.TextIO
+) -> None:
+    ''' Writes result as a single line of JSON.
+
+        Encoded bytes go straight to the underlying binary buffer of UTF-8
+        streams, skipping a decode and re-encode through the text layer.
+        Other streams receive ASCII-escaped text, which any encoding can
+        represent.
+    '''
+    payload = result.render_as_json( )
+    buffer = getattr( stream, 'buffer', None )
+    encoding = getattr( stream, 'encoding', None )
+    if (
+        buffer is None or not encoding
+        or __.codecs.lookup( encoding ).name != 'utf-8'
+    ):
+        text = __.json.dumps( payload, separators = ( ',', ':' ) )
+        stream.write( f'{text}\n' )
+        return
+    encode = _produce_json_line_encoder( )
+    data = encode( payload )
+    stream.flush( )
+    buffer.write( data )
+    buffer.flush( )
+
+
+@__.funct.cache
+def _produce_json_line_encoder(
+) -> __.cabc.Callable[ [ __.typx.Any ], bytes ]:
+    ''' Produces compact UTF-8 JSON line encoder, preferring orjson.
+
+        Imports orjson on first use, so that runs without JSON output do not
+        pay for it.
+    '''
+    try: import orjson
+    except ImportError: # Not available on PyPy.
+        return lambda data: ( __.json.dumps(
+            data, ensure_ascii = False, separators = ( ',', ':' ) ) + '\n'
+        ).encode( )
+    option = orjson.OPT_APPEND_NEWLINE
+    return lambda data: orjson.dumps( data, option = option )
+
+
+def _render_result_as_text(
+    result: RenderableResult, stream: __.typx.TextIO
+) -> None:
+    ''' Writes result as text lines with a single write. '''
+    stream.write( ''.join( f'{line}\n' for line in result.render_as_text( ) ) )
+
+
+_RESULT_RENDERERS: __.immut.Dictionary[
+    DisplayFormats,
+    __.cabc.Callable[ [ RenderableResult, __.typx.TextIO ], None ],
+] = __.immut.Dictionary( {
+    DisplayFormats.Json: _render_result_as_json,
+    DisplayFormats.Text: _render_result_as_text,
+} )
+
+
+def _render_error_as_json(
+    exc: BaseException, stream: __.typx.TextIO
+) -> None:
+    ''' Writes exception as indented JSON. '''
+    if isinstance( exc, _exceptions.Omnierror ):
+        data = exc.render_as_json( )
+    else: data = { 'type': 'unexpected_error', 'message': str( exc ) }
+    stream.write( __.json.dumps( data, indent = 2 ) + '\n' )
+
+
+def _render_error_as_text(
+    exc: BaseException, stream: __.typx.TextIO
+) -> None:
+    ''' Writes exception as Markdown-style text with a single write. '''
+    if isinstance( exc, _exceptions.Omnierror ):
+        lines = exc.render_as_text( )
+    else: lines = ( '## Unexpected Error', f'**Message**: {exc}' )
+    stream.write( ''.join( f'{line}\n' for line in lines ) )
+
+
+_ERROR_RENDERERS: __.immut.Dictionary[
+    DisplayFormats,
+    __.cabc.Callable[ [ BaseException, __.typx.TextIO ], None ],
+] = __.immut.Dictionary( {
+    DisplayFormats.Json: _render_error_as_json,
+    DisplayFormats.Text: _render_error_as_text,
+} )
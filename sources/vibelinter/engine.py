@@ -98,6 +98,13 @@ class Engine:
     ) -> None:
         self.registry_manager = registry_manager
         self.configuration = configuration
+        # Sorted for deterministic order among violations at same position.
+        empty_parameters: __.immut.Dictionary[ str, __.typx.Any ] = (
+            __.immut.Dictionary( ) )
+        self._rule_specifications = tuple(
+            ( vbl_code, configuration.rule_parameters.get(
+                vbl_code, empty_parameters ) )
+            for vbl_code in sorted( configuration.enabled_rules ) )
 
     def lint_file(
         self,
@@ -118,7 +125,10 @@ class Engine:
         ''' Parses source and creates metadata wrapper. '''
         module = __.libcst.parse_module( source_code )
         source_lines = tuple( source_code.splitlines( ) )
-        try: wrapper = __.libcst.metadata.MetadataWrapper( module )
+        # Module is freshly parsed and unshared, so skip defensive deep copy.
+        try:
+            wrapper = __.libcst.metadata.MetadataWrapper(
+                module, unsafe_skip_copy = True )
         except Exception as exc:
             raise _exceptions.MetadataProvideFailure( filename ) from exc
         return wrapper, source_lines
@@ -131,9 +141,7 @@ class Engine:
     ) -> list[ _BaseRule ]:
         ''' Instantiates all enabled rules with configuration. '''
         rules: list[ _BaseRule ] = [ ]
-        for vbl_code in self.configuration.enabled_rules:
-            params = self.configuration.rule_parameters.get(
-                vbl_code, __.immut.Dictionary( ) )
+        for vbl_code, params in self._rule_specifications:
             try:
                 rule = self.registry_manager.produce_rule_instance(
                     vbl_code = vbl_code,
@@ -142,7 +150,7 @@ class Engine:
                     source_lines = source_lines,
                     **params )
                 rules.append( rule )
-            except Exception as exc:
+            except Exception as exc:  # noqa: PERF203
                 raise _exceptions.RuleExecuteFailure( vbl_code ) from exc
         return rules
 
@@ -152,10 +160,13 @@ class Engine:
         wrapper: __.libcst.metadata.MetadataWrapper
     ) -> None:
         ''' Executes rules via single-pass CST traversal. '''
-        for rule in rules:
-            try: wrapper.visit( rule )
-            except Exception as exc:  # noqa: PERF203
-                raise _exceptions.RuleExecuteFailure( rule.rule_id ) from exc
+        with __.ctxl.ExitStack( ) as stack:
+            for rule in rules:
+                try: stack.enter_context( rule.resolve( wrapper ) )
+                except Exception as exc:  # noqa: PERF203
+                    raise _exceptions.RuleExecuteFailure(
+                        rule.rule_id ) from exc
+            wrapper.module.visit( _RulesDispatcher( rules ) )
 
     def _collect_violations(
         self, rules: list[ _BaseRule ]
@@ -164,7 +175,7 @@ class Engine:
         all_violations: list[ _violations.Violation ] = [ ]
         for rule in rules:
             all_violations.extend( rule.violations )
-        all_violations.sort( key = lambda v: ( v.line, v.column ) )
+        all_violations.sort( key = __.operator.attrgetter( 'line', 'column' ) )
         return all_violations
 
     def _extract_suppressions(
@@ -328,14 +339,169 @@ class Engine:
         self,
         file_paths: __.typx.Annotated[
             __.cabc.Sequence[ __.pathlib.Path ],
-            __.ddoc.Doc( 'Paths to Python source files to analyze.' ) ]
+            __.ddoc.Doc( 'Paths to Python source files to analyze.' ) ],
+        workers: __.typx.Annotated[
+            int,
+            __.ddoc.Doc(
+                'Number of worker processes. '
+                'Files are analyzed in current process when one.' ) ] = 1,
     ) -> __.typx.Annotated[
         tuple[ Report, ... ],
         __.ddoc.Doc( 'Analysis results for all files.' ) ]:
         ''' Analyzes multiple Python source files. '''
+        workers = min( workers, len( file_paths ) )
+        if workers > 1:
+            return self._lint_files_concurrently( file_paths, workers )
+        return self._lint_files_serially( file_paths )
+
+    def _lint_files_concurrently(
+        self, file_paths: __.cabc.Sequence[ __.pathlib.Path ], workers: int
+    ) -> tuple[ Report, ... ]:
+        ''' Analyzes source files across pool of worker processes.
+
+            Parsing and rule execution are CPU-bound, so processes rather
+            than threads are used. Files are split into contiguous batches,
+            several per worker to balance load, and the engine is pickled
+            along with each batch. Reports keep input order.
+        '''
+        size = -( -len( file_paths ) // ( workers * 4 ) )
+        batches = tuple(
+            file_paths[ i : i + size ]
+            for i in range( 0, len( file_paths ), size ) )
+        with __.cfutures.ProcessPoolExecutor(
+            max_workers = workers
+        ) as executor:
+            return tuple( __.itert.chain.from_iterable(
+                executor.map( self._lint_files_serially, batches ) ) )
+
+    def _lint_files_serially(
+        self, file_paths: __.cabc.Sequence[ __.pathlib.Path ]
+    ) -> tuple[ Report, ... ]:
+        ''' Analyzes source files in current process, skipping failures. '''
         reports: list[ Report ] = [ ]
         for file_path in file_paths:
             try: report = self.lint_file( file_path )
             except Exception: continue  # noqa: S112
             reports.append( report )
         return tuple( reports )
+
+
+_RuleHandlers: __.typx.TypeAlias = tuple[
+    tuple[ _BaseRule, __.cabc.Callable[ [ __.libcst.CSTNode ], __.typx.Any ] ],
+    ...
+]
+
+
+class _RulesDispatcher( __.libcst.CSTVisitor ):
+    ''' Dispatches each node of one CST traversal to every rule.
+
+        Libcst rebuilds nodes while walking a tree, so one shared walk is
+        much cheaper than a walk per rule. A rule which declines to visit
+        the children of a node receives no callbacks until it leaves that
+        node, as in a traversal of its own.
+
+        Handlers are surveyed once per node type and hook. Only rules which
+        implement a hook are called for it; libcst's no-op stubs are
+        skipped. Rules which override generic hooks, such as 'on_visit',
+        are called through those instead.
+    '''
+
+    def __init__( self, rules: __.cabc.Sequence[ _BaseRule ] ) -> None:
+        super( ).__init__( )
+        self.rules = tuple( rules )
+        self._handlers: dict[ tuple[ str, type, str ], _RuleHandlers ] = { }
+        self._prunings: dict[ _BaseRule, __.libcst.CSTNode ] = { }
+
+    def on_visit( self, node: __.libcst.CSTNode ) -> bool:
+        ''' Visits node with rules, noting any which decline its children.
+
+            Children are visited while any rule still wants them.
+        '''
+        handlers = self._survey_handlers( 'visit', type( node ) )
+        for rule, handler in handlers:
+            if rule in self._prunings: continue
+            if _invoke_rule_handler( rule, handler, node ) is False:
+                self._prunings[ rule ] = node
+        return len( self._prunings ) < len( self.rules )
+
+    def on_visit_attribute(
+        self, node: __.libcst.CSTNode, attribute: str
+    ) -> None:
+        ''' Visits attribute of node with rules which are not pruned. '''
+        handlers = self._survey_handlers( 'visit', type( node ), attribute )
+        for rule, handler in handlers:
+            if rule in self._prunings: continue
+            _invoke_rule_handler( rule, handler, node )
+
+    def on_leave_attribute(
+        self, original_node: __.libcst.CSTNode, attribute: str
+    ) -> None:
+        ''' Leaves attribute of node with rules which are not pruned. '''
+        handlers = self._survey_handlers(
+            'leave', type( original_node ), attribute )
+        for rule, handler in handlers:
+            if rule in self._prunings: continue
+            _invoke_rule_handler( rule, handler, original_node )
+
+    def on_leave( self, original_node: __.libcst.CSTNode ) -> None:
+        ''' Leaves node with rules, resuming those which it pruned.
+
+            A rule which declined the children of the node still leaves it.
+        '''
+        handlers = self._survey_handlers( 'leave', type( original_node ) )
+        prunings = self._prunings
+        for rule, handler in handlers:
+            if prunings.get( rule, original_node ) is not original_node:
+                continue
+            _invoke_rule_handler( rule, handler, original_node )
+        for rule in tuple( prunings ):
+            if prunings[ rule ] is original_node: del prunings[ rule ]
+
+    def _survey_handlers(
+        self, action: str, node_class: type, attribute: str = ''
+    ) -> _RuleHandlers:
+        ''' Surveys rule handlers for hook, caching them by node type. '''
+        key = ( action, node_class, attribute )
+        handlers = self._handlers.get( key )
+        if handlers is not None: return handlers
+        name = f'{action}_{node_class.__name__}'
+        generic = f'on_{action}'
+        if attribute:
+            name = f'{name}_{attribute}'
+            generic = f'{generic}_attribute'
+        default_hook = getattr( __.libcst.CSTVisitor, generic )
+        surveyed: list[ tuple[ _BaseRule, __.typx.Any ] ] = [ ]
+        for rule in self.rules:
+            if getattr( type( rule ), generic ) is not default_hook:
+                method = getattr( rule, generic )
+                if attribute:
+                    method = __.funct.partial(
+                        _call_attribute_hook, method, attribute )
+                surveyed.append( ( rule, method ) )
+                continue
+            method = getattr( rule, name, None )
+            if method is None or getattr( method, '_is_no_op', False ):
+                continue
+            surveyed.append( ( rule, method ) )
+        handlers = self._handlers[ key ] = tuple( surveyed )
+        return handlers
+
+
+def _call_attribute_hook(
+    hook: __.cabc.Callable[ [ __.libcst.CSTNode, str ], None ],
+    attribute: str,
+    node: __.libcst.CSTNode,
+) -> None:
+    ''' Calls generic attribute hook of rule for node attribute. '''
+    hook( node, attribute )
+
+
+def _invoke_rule_handler(
+    rule: _BaseRule,
+    handler: __.cabc.Callable[ [ __.libcst.CSTNode ], __.typx.Any ],
+    node: __.libcst.CSTNode,
+) -> __.typx.Any:
+    ''' Invokes handler of rule for node, wrapping any failure. '''
+    try: return handler( node )
+    except Exception as exc:
+        raise _exceptions.RuleExecuteFailure( rule.rule_id ) from exc
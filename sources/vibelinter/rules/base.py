@@ -135,9 +135,7 @@ class BaseRule( __.libcst.CSTVisitor ):
         ''' Extracts source code context around violation. '''
         start_line = max( 1, line - context_size )
         end_line = min( len( self.source_lines ), line + context_size )
-        context_lines = tuple(
-            self.source_lines[ i ]
-            for i in range( start_line - 1, end_line ) )
+        context_lines = self.source_lines[ start_line - 1 : end_line ]
         if self._violations:
             violation = self._violations[ -1 ]
             return _violations.ViolationContext(
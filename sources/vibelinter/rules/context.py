@@ -54,10 +54,7 @@ class ContextExtractor:
         start_line = max( 1, line - context_size )
         end_line = min( len( self.source_lines ), line + context_size )
         # Extract context lines (convert to 0-indexed for array access)
-        context_lines = tuple(
-            self.source_lines[ i ]
-            for i in range( start_line - 1, end_line )
-        )
+        context_lines = self.source_lines[ start_line - 1 : end_line ]
         return _violations.ViolationContext(
             violation = violation,
             context_lines = context_lines,
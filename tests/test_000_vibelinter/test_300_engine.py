@@ -110,6 +110,69 @@ class MockFailingRule( _base_module.BaseRule ):
         pass
 
 
+class MockPruningRule( _base_module.BaseRule ):
+    ''' Test rule that skips class bodies and flags remaining functions. '''
+
+    def __init__(
+        self, filename: str,
+        wrapper: libcst.metadata.MetadataWrapper,
+        source_lines: tuple[ str, ... ]
+    ) -> None:
+        super( ).__init__( filename, wrapper, source_lines )
+        self.classes_left = 0
+
+    @property
+    def rule_id( self ) -> str:
+        return 'TEST005'
+
+    def visit_ClassDef( self, node: libcst.ClassDef ) -> bool:
+        ''' Declines to visit class body. '''
+        return False
+
+    def leave_ClassDef( self, original_node: libcst.ClassDef ) -> None:
+        ''' Counts classes left, including pruned ones. '''
+        self.classes_left += 1
+
+    def visit_FunctionDef( self, node: libcst.FunctionDef ) -> None:
+        ''' Produces violation for each function outside of classes. '''
+        self._produce_violation( node, 'Pruned test violation', 'error' )
+
+    def _analyze_collections( self ) -> None:
+        ''' No collection analysis needed for this test rule. '''
+        pass
+
+
+class MockGenericHookRule( _base_module.BaseRule ):
+    ''' Test rule that counts nodes through generic visitor hooks. '''
+
+    def __init__(
+        self, filename: str,
+        wrapper: libcst.metadata.MetadataWrapper,
+        source_lines: tuple[ str, ... ]
+    ) -> None:
+        super( ).__init__( filename, wrapper, source_lines )
+        self.nodes_visited = 0
+        self.nodes_left = 0
+
+    @property
+    def rule_id( self ) -> str:
+        return 'TEST006'
+
+    def on_visit( self, node: libcst.CSTNode ) -> bool:
+        ''' Counts every visited node. '''
+        self.nodes_visited += 1
+        return super( ).on_visit( node )
+
+    def on_leave( self, original_node: libcst.CSTNode ) -> None:
+        ''' Counts every left node. '''
+        self.nodes_left += 1
+        super( ).on_leave( original_node )
+
+    def _analyze_collections( self ) -> None:
+        ''' No collection analysis needed for this test rule. '''
+        pass
+
+
 class MockInstantiationFailingRule:
     ''' Test rule that raises exception during instantiation. '''
 
@@ -888,6 +951,33 @@ def test_570_lint_files_handles_mix_of_valid_invalid( mock_registry ):
         assert len( reports ) == 2
 
 
+def test_575_lint_files_with_workers_preserves_file_order(
+    tmp_path, mock_registry, minimal_config
+):
+    ''' lint_files with workers preserves file order in results. '''
+    module = __.cache_import_module( f"{__.PACKAGE_NAME}.engine" )
+    engine = module.Engine( mock_registry, minimal_config )
+    paths = [ tmp_path / f'file{i}.py' for i in range( 5 ) ]
+    for path in paths: path.write_text( 'def f( ):\n    pass\n' )
+    reports = engine.lint_files( paths, workers = 2 )
+    assert [ r.filename for r in reports ] == [ str( p ) for p in paths ]
+    assert all( len( r.violations ) == 1 for r in reports )
+
+
+def test_580_lint_files_with_workers_skips_invalid_files(
+    tmp_path, mock_registry, minimal_config
+):
+    ''' lint_files with workers skips files that fail analysis. '''
+    module = __.cache_import_module( f"{__.PACKAGE_NAME}.engine" )
+    engine = module.Engine( mock_registry, minimal_config )
+    valid = tmp_path / 'valid.py'
+    valid.write_text( 'x = 1\n' )
+    invalid = tmp_path / 'invalid.py'
+    invalid.write_text( 'def broken(\n' )
+    reports = engine.lint_files( [ invalid, valid ], workers = 2 )
+    assert [ r.filename for r in reports ] == [ str( valid ) ]
+
+
 # =============================================================================
 # Integration Tests (600-699)
 # =============================================================================
@@ -1025,6 +1115,43 @@ def test_655_single_pass_traversal_verification( mock_registry, minimal_config )
     assert len( violations ) == 2
 
 
+def test_657_single_pass_traversal_honors_rule_pruning(
+    mock_registry, minimal_config
+):
+    ''' Rule declining children does not stop traversal for other rules. '''
+    module = __.cache_import_module( f"{__.PACKAGE_NAME}.engine" )
+    engine = module.Engine( mock_registry, minimal_config )
+    source = 'class C:\n    def m( self ): pass\ndef f( ): pass\n'
+    wrapper, source_lines = engine._create_metadata_wrapper(
+        source, 'test.py' )
+    pruning_rule = MockPruningRule( 'test.py', wrapper, source_lines )
+    counting_rule = MockViolationRule( 'test.py', wrapper, source_lines )
+    engine._execute_rules( [ pruning_rule, counting_rule ], wrapper )
+    assert len( pruning_rule.violations ) == 1
+    assert pruning_rule.violations[ 0 ].line == 3
+    assert pruning_rule.classes_left == 1
+    assert len( counting_rule.violations ) == 2
+
+
+def test_658_single_pass_traversal_calls_generic_hooks(
+    mock_registry, minimal_config
+):
+    ''' Rules overriding generic hooks see every node of traversal. '''
+    module = __.cache_import_module( f"{__.PACKAGE_NAME}.engine" )
+    engine = module.Engine( mock_registry, minimal_config )
+    source = 'def f( ):\n    return 1\n'
+    wrapper, source_lines = engine._create_metadata_wrapper(
+        source, 'test.py' )
+    alone = MockGenericHookRule( 'test.py', wrapper, source_lines )
+    wrapper.visit( alone )
+    generic_rule = MockGenericHookRule( 'test.py', wrapper, source_lines )
+    counting_rule = MockViolationRule( 'test.py', wrapper, source_lines )
+    engine._execute_rules( [ generic_rule, counting_rule ], wrapper )
+    assert generic_rule.nodes_visited == alone.nodes_visited
+    assert generic_rule.nodes_left == alone.nodes_left
+    assert len( counting_rule.violations ) == 1
+
+
 def test_660_memory_efficient_violation_storage( mock_registry, minimal_config ):
     ''' Memory-efficient violation storage verified. '''
     module = __.cache_import_module( f"{__.PACKAGE_NAME}.engine" )